@@ -0,0 +1,37 @@
+from os import urandom
+from random import getrandbits
+from time import perf_counter
+from types import ModuleType
+from simp import fast, utility
+
+
+GADGETS: list[int] = [getrandbits(48) for _ in range(64)]
+LEAK: bytes = urandom(8 * 100000)
+
+
+def chain(m: ModuleType) -> bytes:
+    out = []
+
+    for i in range(100000):
+        out.append(m.p64(GADGETS[i & 63]))
+        out.append(m.p32(i))
+        out.append(m.p8(i & 0x7f))
+
+    return b''.join(out)
+
+
+def parse(m: ModuleType) -> list[int]:
+    return [m.u64(LEAK[i:i + 8]) for i in range(0, len(LEAK), 8)]
+
+
+def main():
+    for name, m in (('checked', utility), ('fast', fast)):
+        for job in (chain, parse):
+            start = perf_counter()
+            job(m)
+            elapsed = perf_counter() - start
+            print(f'{name:8s} {job.__name__}: {elapsed * 1e3:6.0f} ms{"" if __debug__ else " (-O)"}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+from os import urandom
+from sys import argv
+from time import perf_counter
+from simp.monitor import hexdump
+
+
+def main():
+    mb = int(argv[1]) if len(argv) > 1 else 10
+    data = urandom(mb << 20)
+
+    start = perf_counter()
+    text = hexdump(data, '    <')
+    elapsed = perf_counter() - start
+
+    print(f'{mb} MiB -> {len(text) >> 20} MiB of text in {elapsed:.3f} s ({mb / elapsed:.2f} MiB/s)')
+
+
+if __name__ == '__main__':
+    main()
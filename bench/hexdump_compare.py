@@ -0,0 +1,80 @@
+import sys
+from importlib import import_module, reload
+from os import urandom
+from random import randbytes
+from types import ModuleType
+from typing import Any, Iterator, TextIO
+
+
+class Terminal:
+    def __init__(self, file: TextIO):
+        self.__file: TextIO = file
+
+    def isatty(self) -> bool:
+        return True
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__file, name)
+
+
+def reference(module: ModuleType, data: bytes) -> Iterator[str]:
+    Color = module.Color
+
+    def dumpq(data: bytes) -> str:
+        emphasize = [0x0a, 0x55, 0x7f, 0xff]
+        text = ''
+
+        for i in range(8):
+            if i < len(data):
+                b = data[i]
+
+                if b in emphasize:
+                    text += f'{Color.GREEN}{b:02x}{Color.END}'
+                else:
+                    text += f'{b:02x}'
+            else:
+                text += '  '
+
+        return text
+
+    def dumps(data: bytes) -> str:
+        text = bytearray(data)
+
+        for i, b in enumerate(text):
+            if not ord(' ') <= b <= ord('~'):
+                text[i] = ord('.')
+
+        return text.decode()
+
+    offset = 0
+
+    while data:
+        fst, snd, data = data[:8], data[8:16], data[16:]
+        left, middle, right = dumpq(fst), dumpq(snd), dumps(fst + snd)
+        yield f'{Color.CYAN}[{offset:03x}]{Color.END} {left} {middle} {right}'
+        offset += 0x10
+
+
+def main():
+    stdout = sys.stdout
+    module = import_module('simp.monitor')
+    samples = [bytes(range(0x100)), b'\n\x55\x7f\xff' * 8] + [randbytes(n) for n in [*range(40), 1000, 4097]] + [urandom(0x10000)]
+
+    for tty in (False, True):
+        sys.stdout = Terminal(stdout) if tty else stdout
+
+        try:
+            module = reload(module)
+        finally:
+            sys.stdout = stdout
+
+        assert bool(module.Color.GREEN) == tty
+
+        for data in samples:
+            assert list(module.lines(data)) == list(reference(module, data)), (tty, data)
+
+        print(f'tty={tty}: {len(samples)} samples identical')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+from multiprocessing import Process
+from socket import socket, socketpair
+from sys import argv
+from time import perf_counter
+from simp import BufferedSocket
+
+
+def produce(sk: socket, size: int):
+    with sk:
+        sk.sendall(b'A' * size)
+
+
+def main():
+    for mb in map(int, argv[1:] or [1, 4, 16, 64, 256]):
+        size = mb << 20
+        ours, theirs = socketpair()
+
+        with ours:
+            producer = Process(target=produce, args=(theirs, size))
+            producer.start()
+            theirs.close()
+
+            start = perf_counter()
+            data = BufferedSocket(ours).recvexact(size)
+            elapsed = perf_counter() - start
+
+            producer.join()
+            assert len(data) == size
+
+        print(f'{mb:5d} MiB {elapsed:8.3f} s {mb / elapsed:8.0f} MiB/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+from multiprocessing import Process
+from socket import socket, socketpair
+from sys import argv
+from time import perf_counter
+from simp import BufferedSocket
+
+
+LINE: bytes = b'x' * 31 + b'\n'
+
+
+def bulk(sk: socket, n: int):
+    with sk:
+        for _ in range(n // 100):
+            sk.sendall(LINE * 100)
+
+
+def drip(sk: socket, n: int):
+    with sk:
+        for _ in range(n):
+            sk.sendall(LINE)
+
+
+def main():
+    n = int(argv[1]) if len(argv) > 1 else 200000
+
+    for producer, count in ((bulk, n), (drip, n // 4)):
+        ours, theirs = socketpair()
+
+        with ours:
+            process = Process(target=producer, args=(theirs, count))
+            process.start()
+            theirs.close()
+
+            bs = BufferedSocket(ours)
+            start = perf_counter()
+
+            for _ in range(count):
+                assert bs.recvline(timeout=5) == LINE
+
+            elapsed = perf_counter() - start
+            process.join()
+
+        print(f'{producer.__name__}: {count / elapsed:,.0f} lines/s')
+
+
+if __name__ == '__main__':
+    main()
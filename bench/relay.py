@@ -0,0 +1,33 @@
+from argparse import ArgumentParser
+from socket import socketpair
+from threading import Thread
+from time import perf_counter
+from simp import BufferedSocket, monitor
+from simp.sink import Sink
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--size', type=int, default=64, help='MiB relayed per run (hexdump runs relay 1/16 of it)')
+    parser.add_argument('--backend', choices=['process', 'thread'], default='process')
+    parser.add_argument('--log', default='/dev/null')
+    args = parser.parse_args()
+
+    for verbose in (0, 1, 2):
+        size = (args.size if verbose < 2 else max(args.size // 16, 1)) << 20
+        external, far = socketpair()
+
+        with far, monitor(external, verbose=verbose, backend=args.backend, sink=Sink(args.log)) as internal:
+            bs = BufferedSocket(internal)
+            sender = Thread(target=far.sendall, args=(b'\0A\nB' * (size // 4),))
+            start = perf_counter()
+            sender.start()
+            bs.recvexact_view(size)
+            elapsed = perf_counter() - start
+            sender.join()
+
+        print(f'verbose={verbose}: {size / elapsed / 1e6:8.1f} MB/s')
+
+
+if __name__ == '__main__':
+    main()
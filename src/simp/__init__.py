@@ -1,14 +1,22 @@
+from .asyncbuffered import AsyncBufferedSocket
 from .buffered import BufferedSocket
-from .command import Docker, Tmux, Standalone, run
+from .command import Docker, Pool, Tmux, Standalone, run, tracing
+from .fanout import afanout, fanout
+from .layout import Layout
 from .monitor import monitor
-from .tcpclient import connect, unsafeSSL
-from .utility import block, iota, p16, p32, p64, p8, pd, pf, rol64, ror64, u16, u32, u64, u8, ud, uf
+from .replay import record, replay
+from .tcpclient import aconnect, connect, unsafeSSL
+from .utility import block, cyclic, flat, iota, p16, p32, p64, p8, pack_many, pd, pd_many, pf, pf_many, rol64, ror64, u16, u32, u64, u8, ud, ud_many, uf, uf_many, unpack_array, unpack_many
 
 
 __all__ = [
+    'AsyncBufferedSocket',
     'BufferedSocket',
-    'Docker', 'Tmux', 'Standalone', 'run',
+    'Docker', 'Pool', 'Tmux', 'Standalone', 'run', 'tracing',
+    'afanout', 'fanout',
+    'Layout',
     'monitor',
-    'connect', 'unsafeSSL',
-    'block', 'iota', 'p16', 'p32', 'p64', 'p8', 'pd', 'pf', 'rol64', 'ror64', 'u16', 'u32', 'u64', 'u8', 'ud', 'uf',
+    'record', 'replay',
+    'aconnect', 'connect', 'unsafeSSL',
+    'block', 'cyclic', 'flat', 'iota', 'p16', 'p32', 'p64', 'p8', 'pack_many', 'pd', 'pd_many', 'pf', 'pf_many', 'rol64', 'ror64', 'u16', 'u32', 'u64', 'u8', 'ud', 'ud_many', 'uf', 'uf_many', 'unpack_array', 'unpack_many',
 ]
@@ -0,0 +1,193 @@
+from asyncio import BaseTransport, Future, Protocol, Timeout, Transport, get_running_loop, timeout as timeout_
+from typing import Callable, Self, cast
+from .buffered import Buffer
+
+
+def deadline(timeout: float) -> Timeout:
+    return timeout_(timeout if timeout > 0 else None)
+
+
+class StreamProtocol(Protocol):
+    def __init__(self, limit: int = 0x100000):
+        self.buffer: Buffer = Buffer()
+        self.eof: bool = False
+        self.__limit: int = limit
+        self.__transport: Transport | None = None
+        self.__waiter: Future[None] | None = None
+        self.__drainer: Future[None] | None = None
+        self.__paused: bool = False
+        self.__throttled: bool = False
+
+    @staticmethod
+    def __wake(waiter: Future[None] | None):
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+    def connection_made(self, transport: BaseTransport):
+        self.__transport = cast(Transport, transport)
+
+    def data_received(self, data: bytes):
+        self.buffer.write(data)
+        self.__wake(self.__waiter)
+
+        if self.__transport and not self.__throttled and len(self.buffer) > self.__limit:
+            self.__transport.pause_reading()
+            self.__throttled = True
+
+    def release(self):
+        if self.__transport and self.__throttled and not self.eof:
+            self.__throttled = False
+            self.__transport.resume_reading()
+
+    def consumed(self):
+        if len(self.buffer) <= self.__limit:
+            self.release()
+
+    def eof_received(self):
+        self.eof = True
+        self.__wake(self.__waiter)
+
+    def connection_lost(self, exc: Exception | None):
+        self.eof = True
+        self.__paused = False
+        self.__wake(self.__waiter)
+        self.__wake(self.__drainer)
+
+    def pause_writing(self):
+        self.__paused = True
+
+    def resume_writing(self):
+        self.__paused = False
+        self.__wake(self.__drainer)
+
+    async def wait(self):
+        self.release()
+        self.__waiter = get_running_loop().create_future()
+
+        try:
+            await self.__waiter
+        finally:
+            self.__waiter = None
+
+    async def drain(self, timeout: float = -1):
+        if not self.__paused:
+            return
+
+        if not timeout:
+            raise BlockingIOError
+
+        self.__drainer = get_running_loop().create_future()
+
+        try:
+            await self.__drainer
+        finally:
+            self.__drainer = None
+
+
+class AsyncBufferedSocket:
+    def __init__(self, transport: BaseTransport, protocol: StreamProtocol):
+        self.__transport: Transport = cast(Transport, transport)
+        self.__protocol: StreamProtocol = protocol
+        self.__buffer: Buffer = protocol.buffer
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_):
+        self.close()
+
+    def close(self):
+        self.__transport.close()
+
+    async def __send(self, buffers: list[bytes], timeout: float):
+        if self.__transport.is_closing():
+            raise ConnectionResetError
+
+        for buffer in buffers:
+            self.__transport.write(buffer)
+        await self.__protocol.drain(timeout)
+
+    async def send(self, *data: bytes, timeout: float = -1):
+        async with deadline(timeout):
+            await self.__send(list(data), timeout)
+
+    async def sendline(self, *data: bytes, timeout: float = -1):
+        async with deadline(timeout):
+            await self.__send([*data, b'\n'], timeout)
+
+    async def recv(self, *, size: int = -1, timeout: float = -1) -> bytes:
+        async with deadline(timeout):
+            if not self.__protocol.eof and timeout and not self.__buffer:
+                await self.__protocol.wait()
+
+        size = size if size >= 0 else len(self.__buffer)
+        data = self.__buffer.read(size)
+        self.__protocol.consumed()
+
+        if not self.__protocol.eof and size and not data:
+            raise BlockingIOError
+
+        return data
+
+    async def __recvcond(self, cond: Callable[[int], int], timeout: float) -> bytes:
+        start = 0
+
+        while (pos := cond(start)) < 0:
+            start = len(self.__buffer)
+
+            while len(self.__buffer) == start:
+                if self.__protocol.eof:
+                    raise EOFError
+
+                if not timeout:
+                    raise BlockingIOError
+
+                await self.__protocol.wait()
+
+        data = self.__buffer.read(pos)
+        self.__protocol.consumed()
+        return data
+
+    async def recvcond(self, cond: Callable[[bytes, int], int], *, timeout: float = -1) -> bytes:
+        async with deadline(timeout):
+            return await self.__recvcond(lambda start: cond(self.__buffer.peek(), start), timeout)
+
+    async def __recvuntil(self, delim: bytes, timeout: float) -> bytes:
+        def cond(start: int) -> int:
+            pos = self.__buffer.find(delim, max(start - len(delim) + 1, 0))
+
+            if pos != -1:
+                pos += len(delim)
+                return pos
+            else:
+                return -1
+
+        return await self.__recvcond(cond, timeout)
+
+    async def recvuntil(self, delim: bytes, *, timeout: float = -1) -> bytes:
+        async with deadline(timeout):
+            return await self.__recvuntil(delim, timeout)
+
+    async def recvexact(self, n: int, *, timeout: float = -1) -> bytes:
+        def cond(_: int) -> int:
+            if len(self.__buffer) >= n:
+                return n
+            else:
+                return -1
+
+        async with deadline(timeout):
+            return await self.__recvcond(cond, timeout)
+
+    async def recvline(self, *, timeout: float = -1) -> bytes:
+        async with deadline(timeout):
+            return await self.__recvuntil(b'\n', timeout)
+
+    async def sendafter(self, delim: bytes, data: bytes, *, timeout: float = -1):
+        async with deadline(timeout):
+            await self.__recvuntil(delim, timeout)
+            await self.__send([data], timeout)
+
+    async def sendlineafter(self, delim: bytes, data: bytes, *, timeout: float = -1):
+        async with deadline(timeout):
+            await self.__recvuntil(delim, timeout)
+            await self.__send([data, b'\n'], timeout)
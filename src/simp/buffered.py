@@ -1,78 +1,337 @@
-from contextlib import suppress
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
+from math import inf
+from selectors import EVENT_READ, EVENT_WRITE, DefaultSelector
 from socket import socket
-from ssl import SSLWantReadError, SSLWantWriteError
+from ssl import SSLSocket, SSLWantReadError, SSLWantWriteError
 from sys import platform
-from typing import Callable
+from time import monotonic, perf_counter
+from typing import Callable, Iterator
+
+
+class Buffer:
+    def __init__(self, capacity: int = 0x1000):
+        self.__capacity: int = capacity
+        self.__data: bytearray = bytearray(capacity)
+        self.__head: int = 0
+        self.__tail: int = 0
+
+    def __len__(self) -> int:
+        return self.__tail - self.__head
+
+    def reserve(self, size: int):
+        if len(self.__data) - self.__tail >= size:
+            return
+
+        length = len(self)
+
+        if self.__head:
+            with memoryview(self.__data) as view:
+                view[:length] = view[self.__head:self.__tail]
+
+        if self.__head < length or len(self.__data) - length < size:
+            extra = bytes(max(len(self.__data), length + size - len(self.__data)))
+
+            try:
+                self.__data.extend(extra)
+            except BufferError:
+                self.__data = self.__data + extra
+
+        self.__head, self.__tail = 0, length
+
+    def write(self, data: bytes):
+        self.reserve(len(data))
+        self.__data[self.__tail:self.__tail + len(data)] = data
+        self.__tail += len(data)
+
+    def fill(self, recv_into: Callable[[memoryview], int], size: int) -> int:
+        self.reserve(size)
+
+        with memoryview(self.__data) as view:
+            n = recv_into(view[self.__tail:self.__tail + size])
+
+        self.__tail += n
+        return n
+
+    def drain(self, send: Callable[[memoryview], int]) -> int:
+        with memoryview(self.__data) as view:
+            n = send(view[self.__head:self.__tail])
+
+        self.__consume(n)
+        return n
+
+    def peek(self, size: int = -1) -> bytes:
+        size = len(self) if size < 0 else min(size, len(self))
+
+        with memoryview(self.__data) as view:
+            return bytes(view[self.__head:self.__head + size])
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        pos = self.__data.find(sub, self.__head + start, self.__tail)
+        return pos - self.__head if pos != -1 else -1
+
+    def __consume(self, size: int):
+        self.__head += size
+
+        if self.__head == self.__tail:
+            self.__head = self.__tail = 0
+
+            if len(self.__data) > max(self.__capacity, 0x100000):
+                self.__data = bytearray(self.__capacity)
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.peek(size)
+        self.__consume(len(data))
+        return data
+
+    def readinto(self, buffer: memoryview) -> int:
+        size = min(len(buffer), len(self))
+
+        with memoryview(self.__data) as view:
+            buffer[:size] = view[self.__head:self.__head + size]
+
+        self.__consume(size)
+        return size
+
+
+@dataclass
+class Chunk:
+    size: int = 0x1000
+    minimum: int = 0x1000
+    maximum: int = 0x40000
+    saved: int = 0
+
+    def update(self, n: int):
+        self.saved += max((n + self.minimum - 1) // self.minimum - 1, 0)
+
+        if n >= self.size:
+            self.size = min(self.size * 2, self.maximum)
+
+    def idle(self):
+        self.size = max(self.size // 2, self.minimum)
+
+
+@dataclass
+class Stats:
+    received: int = 0
+    sent: int = 0
+    recvs: int = 0
+    sends: int = 0
+    blocked: float = 0
+    syscall: float = 0
+    highwater: int = 0
+    rescans: int = 0
+    start: float = field(default_factory=perf_counter)
+    hook: Callable[['Stats'], None] | None = None
+
+    @property
+    def elapsed(self) -> float:
+        return perf_counter() - self.start
+
+    @property
+    def processing(self) -> float:
+        return self.elapsed - self.blocked
+
+    def update(self, events: int, n: int, elapsed: float, buffered: int):
+        if events == EVENT_READ:
+            self.recvs += 1
+            self.received += n
+        else:
+            self.sends += 1
+            self.sent += n
+
+        self.syscall += elapsed
+        self.highwater = max(self.highwater, buffered)
+
+        if self.hook:
+            self.hook(self)
+
+
+def deadline(timeout: float) -> float | None:
+    if timeout < 0:
+        return inf
+
+    if timeout == 0:
+        return None
+
+    return monotonic() + timeout
 
 
 class BufferedSocket:
-    def __init__(self, sk: socket):
+    def __init__(self, sk: socket, *, chunk: Chunk | None = None, stats: Stats | None = None):
         self.__sk: socket = sk
-        self.__buffer: bytes = b''
+        self.__sk.setblocking(False)
+        self.__selector: DefaultSelector = DefaultSelector()
+        self.__selector.register(sk, EVENT_READ)
+        self.__events: int = EVENT_READ
+        self.__buffer: Buffer = Buffer()
         self.__eof: bool = False
+        self.__vectored: bool = hasattr(sk, 'sendmsg') and not isinstance(sk, SSLSocket)
+        self.__corked: bool = False
+        self.__pending: list[bytes] = []
+        self.chunk: Chunk = chunk if chunk else Chunk()
+        self.stats: Stats | None = stats
 
-    def _send(self, data: bytes) -> int:
-        return self.__sk.send(data)
+    def _send(self, buffers: list[memoryview]) -> int:
+        if self.__vectored:
+            return self.__sk.sendmsg(buffers)
+        elif len(buffers) == 1:
+            return self.__sk.send(buffers[0])
+        else:
+            return self.__sk.send(b''.join(buffers))
 
-    def _recv(self, *, timeout: float = -1) -> bytes:
-        timeout_ = timeout if timeout >= 0 else None
-        self.__sk.settimeout(timeout_)
-        return self.__sk.recv(0x1000)
+    def _recv_into(self, buffer: memoryview) -> int:
+        return self.__sk.recv_into(buffer)
 
-    def send(self, data: bytes):
-        while data:
-            n = self._send(data)
-            data = data[n:]
+    def __wait(self, events: int, deadline: float | None):
+        if deadline is None:
+            raise BlockingIOError
 
-    def sendline(self, data: bytes):
-        return self.send(data + b'\n')
+        timeout = deadline - monotonic()
 
-    def recv(self, *, size: int = -1, timeout: float = -1) -> bytes:
-        if not self.__eof:
-            with suppress(BlockingIOError, SSLWantReadError, SSLWantWriteError):
-                while data := self._recv(timeout=0):
-                    self.__buffer += data
+        if timeout <= 0:
+            raise TimeoutError
+
+        if self.__events != events:
+            self.__selector.modify(self.__sk, events)
+            self.__events = events
+
+        start = perf_counter()
+        ready = self.__selector.select(timeout if timeout != inf else None)
+
+        if self.stats:
+            self.stats.blocked += perf_counter() - start
 
+        if not ready:
+            raise TimeoutError
+
+    def __retry(self, op: Callable[[], int], events: int, deadline: float | None) -> int:
+        while True:
+            try:
+                if not self.stats:
+                    return op()
+
+                start = perf_counter()
+                n = op()
+                self.stats.update(events, n, perf_counter() - start, len(self.__buffer))
+                return n
+            except SSLWantReadError:
+                self.__wait(EVENT_READ, deadline)
+            except SSLWantWriteError:
+                self.__wait(EVENT_WRITE, deadline)
+            except BlockingIOError:
+                self.__wait(events, deadline)
+
+    def __read(self) -> int:
+        n = self.__buffer.fill(self._recv_into, self.chunk.size)
+        self.chunk.update(n)
+        return n
+
+    def __fill(self, deadline: float | None, known: int):
+        while not self.__eof:
+            size = self.chunk.size
+
+            try:
+                n = self.__retry(self.__read, EVENT_READ, deadline if len(self.__buffer) <= known else None)
+            except BlockingIOError:
+                self.chunk.idle()
+                return
+
+            if not n:
                 self.__eof = True
+            elif n < size and len(self.__buffer) > known:
+                return
+
+    def __send(self, buffers: list[bytes], deadline: float | None):
+        if self.__corked:
+            self.__pending += [b if isinstance(b, bytes) else bytes(b) for b in buffers]
+            return
+
+        buffers, self.__pending = self.__pending + buffers, []
+        views = [view for view in (memoryview(b).cast('B') for b in buffers) if view]
+        i = 0
 
-        if not self.__eof and timeout and not self.__buffer:
-            if data := self._recv(timeout=timeout):
-                self.__buffer += data
+        while i < len(views):
+            n = self.__retry(lambda: self._send(views[i:i + 0x400]), EVENT_WRITE, deadline)
+
+            while i < len(views) and n >= len(views[i]):
+                n -= len(views[i])
+                i += 1
+
+            if n:
+                views[i] = views[i][n:]
+
+    def send(self, *data: bytes, timeout: float = -1):
+        self.__send(list(data), deadline(timeout))
+
+    def sendline(self, *data: bytes, timeout: float = -1):
+        self.__send([*data, b'\n'], deadline(timeout))
+
+    def flush(self, *, timeout: float = -1):
+        corked, self.__corked = self.__corked, False
+
+        try:
+            self.__send([], deadline(timeout))
+        finally:
+            self.__corked = corked
+
+    @contextmanager
+    def cork(self) -> Iterator[None]:
+        corked, self.__corked = self.__corked, True
+        pending, mark = self.__pending, len(self.__pending)
+
+        try:
+            yield
+        except BaseException:
+            if self.__pending is pending:
+                del self.__pending[mark:]
             else:
-                self.__eof = True
+                self.__pending.clear()
 
+            raise
+        finally:
+            self.__corked = corked
+
+        if not corked:
+            self.flush()
+
+    def recv(self, *, size: int = -1, timeout: float = -1) -> bytes:
+        deadline_ = deadline(timeout)
+        self.__fill(deadline_, 0)
         size = size if size >= 0 else len(self.__buffer)
-        data, self.__buffer = self.__buffer[:size], self.__buffer[size:]
+        data = self.__buffer.read(size)
 
         if not self.__eof and size and not data:
-            assert (not timeout)
+            assert (deadline_ is None)
             raise BlockingIOError
 
         return data
 
-    def __cancel(self, data: bytes):
-        self.__buffer = data + self.__buffer
+    def __recvcond(self, cond: Callable[[int], int], deadline: float | None) -> bytes:
+        start = 0
 
-    def recvcond(self, cond: Callable[[bytes], int], *, timeout: float = -1) -> bytes:
-        data = b''
+        while (pos := cond(start)) < 0:
+            if self.stats:
+                self.stats.rescans += 1
 
-        while True:
-            try:
-                data += self.recv(timeout=timeout)
-            except:
-                self.__cancel(data)
-                raise
+            start = len(self.__buffer)
+            self.__fill(deadline, start)
 
-            pos = cond(data)
+            if len(self.__buffer) == start:
+                if self.__eof:
+                    raise EOFError
 
-            if pos >= 0:
-                data, rest = data[:pos], data[pos:]
-                self.__cancel(rest)
-                return data
+                assert (deadline is None)
+                raise BlockingIOError
 
-    def recvuntil(self, delim: bytes, *, timeout: float = -1) -> bytes:
-        def cond(data: bytes) -> int:
-            pos = data.find(delim)
+        return self.__buffer.read(pos)
+
+    def recvcond(self, cond: Callable[[bytes, int], int], *, timeout: float = -1) -> bytes:
+        return self.__recvcond(lambda start: cond(self.__buffer.peek(), start), deadline(timeout))
+
+    def __recvuntil(self, delim: bytes, deadline: float | None) -> bytes:
+        def cond(start: int) -> int:
+            pos = self.__buffer.find(delim, max(start - len(delim) + 1, 0))
 
             if pos != -1:
                 pos += len(delim)
@@ -80,27 +339,69 @@ class BufferedSocket:
             else:
                 return -1
 
-        return self.recvcond(cond, timeout=timeout)
+        return self.__recvcond(cond, deadline)
+
+    def recvuntil(self, delim: bytes, *, timeout: float = -1) -> bytes:
+        return self.__recvuntil(delim, deadline(timeout))
 
     def recvexact(self, n: int, *, timeout: float = -1) -> bytes:
-        def cond(data: bytes) -> int:
-            if len(data) >= n:
+        def cond(_: int) -> int:
+            if len(self.__buffer) >= n:
                 return n
             else:
                 return -1
 
-        return self.recvcond(cond, timeout=timeout)
+        return self.__recvcond(cond, deadline(timeout))
+
+    def recv_into(self, buffer: bytearray | memoryview, *, timeout: float = -1) -> int:
+        with memoryview(buffer) as view:
+            if n := self.__buffer.readinto(view):
+                return n
+
+            if self.__eof or not view:
+                return 0
+
+            if not (n := self.__retry(lambda: self._recv_into(view), EVENT_READ, deadline(timeout))):
+                self.__eof = True
+
+            return n
+
+    def recvexact_into(self, buffer: bytearray | memoryview, *, timeout: float = -1):
+        deadline_ = deadline(timeout)
+
+        with memoryview(buffer) as view:
+            pos = self.__buffer.readinto(view)
+
+            try:
+                while pos < len(view):
+                    if self.__eof:
+                        raise EOFError
+
+                    if not (n := self.__retry(lambda: self._recv_into(view[pos:]), EVENT_READ, deadline_)):
+                        self.__eof = True
+
+                    pos += n
+            except:
+                self.__buffer.write(view[:pos])
+                raise
+
+    def recvexact_view(self, n: int, *, timeout: float = -1) -> memoryview:
+        buffer = bytearray(n)
+        self.recvexact_into(buffer, timeout=timeout)
+        return memoryview(buffer)
 
     def recvline(self, *, timeout: float = -1) -> bytes:
-        return self.recvuntil(b'\n', timeout=timeout)
+        return self.__recvuntil(b'\n', deadline(timeout))
 
     def sendafter(self, delim: bytes, data: bytes, *, timeout: float = -1):
-        self.recvuntil(delim, timeout=timeout)
-        self.send(data)
+        deadline_ = deadline(timeout)
+        self.__recvuntil(delim, deadline_)
+        self.__send([data], deadline_)
 
     def sendlineafter(self, delim: bytes, data: bytes, *, timeout: float = -1):
-        self.recvuntil(delim, timeout=timeout)
-        self.sendline(data)
+        deadline_ = deadline(timeout)
+        self.__recvuntil(delim, deadline_)
+        self.__send([data, b'\n'], deadline_)
 
     def interactive(self):
         if platform == 'linux':
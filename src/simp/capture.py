@@ -0,0 +1,64 @@
+from socket import AF_INET, inet_aton, socket
+from struct import Struct
+from time import time_ns
+from typing import BinaryIO
+
+
+SHB: Struct = Struct('<IIIHHqI')
+IDB: Struct = Struct('<IIHHII')
+EPB: Struct = Struct('<IIIIIII')
+PACKET: Struct = Struct('>BBHHHBBH4s4sHHIIBBHHH')
+TRAILER: Struct = Struct('<HHIHHI')
+
+LINKTYPE_RAW: int = 101
+SEGMENT: int = 0xffff - 40
+
+
+def endpoints(sk: socket) -> tuple[tuple[str, int], tuple[str, int]]:
+    if sk.family == AF_INET:
+        return sk.getsockname(), sk.getpeername()
+    else:
+        return ('10.0.0.1', 0xc000), ('10.0.0.2', 0x539)
+
+
+class Capture:
+    def __init__(self, path: str, client: tuple[str, int], server: tuple[str, int], buffering: int = 0x100000):
+        self.__file: BinaryIO = open(path, 'wb', buffering=buffering)
+        self.__client: tuple[bytes, int] = (inet_aton(client[0]), client[1])
+        self.__server: tuple[bytes, int] = (inet_aton(server[0]), server[1])
+        self.__seq: dict[bool, int] = {True: 0, False: 0}
+
+        self.__file.write(SHB.pack(0x0a0d0d0a, SHB.size, 0x1a2b3c4d, 1, 0, -1, SHB.size))
+        self.__file.write(IDB.pack(1, IDB.size, LINKTYPE_RAW, 0, 0, IDB.size))
+
+        self.__segment(True, b'', 0x02)
+        self.__seq[True] += 1
+        self.__segment(False, b'', 0x12)
+        self.__seq[False] += 1
+        self.__segment(True, b'', 0x10)
+
+    def __segment(self, outbound: bool, data: bytes | memoryview, flags: int):
+        src, dst = (self.__client, self.__server) if outbound else (self.__server, self.__client)
+        ts = time_ns() // 1000
+        size = PACKET.size + len(data)
+        padding = -size & 3
+        total = EPB.size + size + padding + TRAILER.size
+
+        self.__file.write(
+            EPB.pack(6, total, 0, ts >> 32, ts & 0xffffffff, size, size) +
+            PACKET.pack(
+                0x45, 0, size, 0, 0x4000, 64, 6, 0, src[0], dst[0],
+                src[1], dst[1], self.__seq[outbound], self.__seq[not outbound], 0x50, flags, 0xffff, 0, 0))
+        self.__file.write(data)
+        self.__file.write(bytes(padding) + TRAILER.pack(2, 4, 2 if outbound else 1, 0, 0, total))
+
+    def record(self, data: bytes, outbound: bool):
+        view = memoryview(data)
+
+        for i in range(0, len(view), SEGMENT):
+            segment = view[i:i + SEGMENT]
+            self.__segment(outbound, segment, 0x18)
+            self.__seq[outbound] = (self.__seq[outbound] + len(segment)) & 0xffffffff
+
+    def close(self):
+        self.__file.close()
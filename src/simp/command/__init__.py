@@ -1,6 +1,8 @@
 from sys import platform
 from .docker import Docker
+from .pool import Pool
 from .tmux import Tmux
+from .trace import tracing
 
 match platform:
     case 'linux':
@@ -11,6 +13,8 @@ match platform:
 
 __all__ = [
     'Docker',
+    'Pool',
     'Tmux',
-    'Standalone', 'run'
+    'Standalone', 'run',
+    'tracing',
 ]
@@ -1,6 +1,7 @@
 from abc import ABCMeta, abstractmethod
 from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
 from typing import Iterator
+from .trace import span
 
 
 class Executor[Redirect](metaclass=ABCMeta):
@@ -35,7 +36,8 @@ def run[Helper, Connection: AbstractContextManager, Redirect: AbstractContextMan
         bridge: Bridge[Connection, Redirect] | None) -> Iterator[tuple[Helper, Connection | None]]:
 
     if bridge:
-        connection, redirect = bridge()
+        with span('bridge', bridge=type(bridge).__name__):
+            connection, redirect = bridge()
     else:
         connection, redirect = None, None
 
@@ -44,6 +46,9 @@ def run[Helper, Connection: AbstractContextManager, Redirect: AbstractContextMan
             if redirect:
                 estack.enter_context(redirect)
 
-            with launcher(executor, redirect=redirect) as helper:
+            with ExitStack() as lstack:
+                with span('launch', launcher=type(launcher).__name__):
+                    helper = lstack.enter_context(launcher(executor, redirect=redirect))
+
                 estack.pop_all().close()
                 yield (helper, connection)
@@ -2,6 +2,7 @@ from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from typing import Callable, Iterator
 from .base import Executor, Launcher
+from .trace import span
 
 
 __all__ = [
@@ -55,7 +56,8 @@ class Attacher(Launcher[Callable[[], None]]):
         with executor.remote(self.run(), redirect=redirect, interactive=bool(redirect), tracable=True) as pid:
             with ExitStack() as estack:
                 def attach():
-                    estack.enter_context(executor.remote(self.attach(pid)))
-                    estack.enter_context(executor.local(self.cli(), interactive=True))
+                    with span('attach', launcher=type(self).__name__, pid=pid):
+                        estack.enter_context(executor.remote(self.attach(pid)))
+                        estack.enter_context(executor.local(self.cli(), interactive=True))
 
                 yield attach
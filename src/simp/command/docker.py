@@ -1,9 +1,10 @@
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from shlex import join, quote
 from subprocess import run
 from typing import Iterator
 from .base import Executor
+from .trace import span
 
 
 @dataclass
@@ -55,5 +56,11 @@ class Docker[Redirect](Executor[Redirect]):
         args = ['-i'] if interactive else []
         command = self.exec(command, *args)
 
-        with self.executor.remote(command, redirect=redirect, interactive=interactive, wait=wait):
-            yield getpid()
+        with ExitStack() as estack:
+            with span('docker.exec', container=self.name, command=command):
+                estack.enter_context(self.executor.remote(command, redirect=redirect, interactive=interactive, wait=wait))
+
+            with span('docker.getpid', container=self.name) if tracable else nullcontext():
+                pid = getpid()
+
+            yield pid
@@ -2,6 +2,7 @@ from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass, field
 from typing import Callable, Iterator
 from .base import Executor, Launcher
+from .trace import span
 
 __all__ = [
     'Alias', 'Attacher', 'Debugger'
@@ -92,6 +93,7 @@ class Attacher(Launcher[Callable[[], None]]):
             with executor.remote(self.run(), redirect=redirect, interactive=bool(redirect), tracable=True) as pid:
                 with ExitStack() as estack:
                     def attach():
-                        estack.enter_context(executor.local(self.cli(pid), interactive=True))
+                        with span('attach', launcher=type(self).__name__, pid=pid):
+                            estack.enter_context(executor.local(self.cli(pid), interactive=True))
 
                     yield attach
@@ -5,6 +5,7 @@ from socket import socket
 from subprocess import DEVNULL, Popen, TimeoutExpired
 from typing import IO, Iterator, cast
 from ..base import Executor
+from ..trace import span
 
 
 class Glibc:
@@ -37,17 +38,21 @@ class Standalone(Executor[socket]):
         stdout = stderr = cast(IO, redirect) if redirect else None
         preexec_fn = pr_set_ptracer_any if tracable else None
 
-        with Popen(command, stdin=stdin, stdout=stdout, stderr=stderr, process_group=process_group, preexec_fn=preexec_fn) as popen:
+        with span('popen', command=command):
+            popen = Popen(command, stdin=stdin, stdout=stdout, stderr=stderr, process_group=process_group, preexec_fn=preexec_fn)
+
+        with popen:
             try:
                 yield popen.pid
             finally:
                 if not wait and popen.poll() is None:
-                    popen.terminate()
+                    with span('terminate', pid=popen.pid):
+                        popen.terminate()
 
-                    try:
-                        popen.wait(1)
-                    except TimeoutExpired:
-                        popen.kill()
+                        try:
+                            popen.wait(1)
+                        except TimeoutExpired:
+                            popen.kill()
 
     @contextmanager
     def remote(self, command: list[str], *, redirect: socket | None = None, interactive: bool = False, tracable: bool = False, wait: bool = False) -> Iterator[int]:
@@ -0,0 +1,72 @@
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from contextvars import copy_context
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from typing import Callable, Iterator, Self
+
+
+class Pool[T]:
+    def __init__(self, factory: Callable[[], AbstractContextManager[T]], *, size: int = 4, workers: int = 2):
+        self.__factory: Callable[[], AbstractContextManager[T]] = factory
+        self.__queue: Queue[tuple[ExitStack, T] | Exception] = Queue(size)
+        self.__closed: Event = Event()
+        self.__fillers: list[Thread] = [Thread(target=copy_context().run, args=(self.__fill,), daemon=True) for _ in range(workers)]
+
+        for filler in self.__fillers:
+            filler.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __spawn(self) -> tuple[ExitStack, T] | Exception:
+        try:
+            with ExitStack() as estack:
+                value = estack.enter_context(self.__factory())
+                return (estack.pop_all(), value)
+        except Exception as e:
+            return e
+
+    def __fill(self):
+        while not self.__closed.is_set():
+            entry = self.__spawn()
+
+            while not self.__closed.is_set():
+                try:
+                    self.__queue.put(entry, timeout=0.1)
+                    break
+                except Full:
+                    pass
+            else:
+                if isinstance(entry, tuple):
+                    entry[0].close()
+
+    @contextmanager
+    def acquire(self, *, timeout: float = -1) -> Iterator[T]:
+        try:
+            entry = self.__queue.get(timeout != 0, timeout if timeout > 0 else None)
+        except Empty:
+            raise BlockingIOError if timeout == 0 else TimeoutError
+
+        if isinstance(entry, Exception):
+            raise entry
+
+        with entry[0]:
+            yield entry[1]
+
+    def close(self):
+        self.__closed.set()
+
+        for filler in self.__fillers:
+            filler.join()
+
+        while True:
+            try:
+                entry = self.__queue.get_nowait()
+            except Empty:
+                break
+
+            if isinstance(entry, tuple):
+                entry[0].close()
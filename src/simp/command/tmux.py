@@ -1,7 +1,8 @@
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass, field
 from typing import Iterator
 from .base import Executor
+from .trace import span
 
 
 @dataclass
@@ -23,20 +24,30 @@ class Tmux[Redirect](Executor[Redirect]):
 
     @contextmanager
     def local(self, command: list[str], *, redirect: Redirect | None = None, interactive: bool = False, tracable: bool = False, wait: bool = False) -> Iterator[int]:
-        if not redirect and interactive:
+        split = not redirect and interactive
+
+        if split:
             command = self.split(command)
             interactive = False
             wait = True
 
-        with self.executor.local(command, redirect=redirect, interactive=interactive, tracable=tracable, wait=wait) as pid:
+        with ExitStack() as estack:
+            with span('tmux.split', command=command) if split else nullcontext():
+                pid = estack.enter_context(self.executor.local(command, redirect=redirect, interactive=interactive, tracable=tracable, wait=wait))
+
             yield pid
 
     @contextmanager
     def remote(self, command: list[str], *, redirect: Redirect | None = None, interactive: bool = False, tracable: bool = False, wait: bool = False) -> Iterator[int]:
-        if not redirect and interactive:
+        split = not redirect and interactive
+
+        if split:
             command = self.split(command)
             interactive = False
             wait = True
 
-        with self.executor.remote(command, redirect=redirect, interactive=interactive, tracable=tracable, wait=wait) as pid:
+        with ExitStack() as estack:
+            with span('tmux.split', command=command) if split else nullcontext():
+                pid = estack.enter_context(self.executor.remote(command, redirect=redirect, interactive=interactive, tracable=tracable, wait=wait))
+
             yield pid
@@ -0,0 +1,74 @@
+from contextlib import closing, contextmanager
+from contextvars import ContextVar
+from json import dumps
+from os import getpid
+from threading import Lock, get_native_id
+from time import perf_counter_ns, time_ns
+from typing import Any, Iterator, Literal, TextIO
+
+
+type Format = Literal['jsonl', 'chrome']
+
+
+class Tracer:
+    def __init__(self, path: str, format: Format = 'jsonl'):
+        self.__file: TextIO = open(path, 'w')
+        self.__format: Format = format
+        self.__lock: Lock = Lock()
+        self.__count: int = 0
+
+        if format == 'chrome':
+            self.__file.write('[')
+
+    def emit(self, name: str, start: int, duration: int, args: dict[str, Any]):
+        match self.__format:
+            case 'jsonl':
+                event = {'name': name, 'start': start / 1e9, 'duration': duration / 1e9, 'pid': getpid(), 'tid': get_native_id(), 'args': args}
+
+            case 'chrome':
+                event = {'name': name, 'ph': 'X', 'ts': start / 1e3, 'dur': duration / 1e3, 'pid': getpid(), 'tid': get_native_id(), 'args': args}
+
+        line = dumps(event, default=str)
+
+        with self.__lock:
+            if self.__format == 'chrome' and self.__count:
+                self.__file.write(',\n')
+
+            self.__file.write(line if self.__format == 'chrome' else line + '\n')
+            self.__file.flush()
+            self.__count += 1
+
+    def close(self):
+        if self.__format == 'chrome':
+            self.__file.write(']\n')
+
+        self.__file.close()
+
+
+tracer: ContextVar[Tracer | None] = ContextVar('tracer', default=None)
+
+
+@contextmanager
+def tracing(path: str, format: Format = 'jsonl') -> Iterator[Tracer]:
+    with closing(Tracer(path, format)) as tracer_:
+        token = tracer.set(tracer_)
+
+        try:
+            yield tracer_
+        finally:
+            tracer.reset(token)
+
+
+@contextmanager
+def span(name: str, **args: Any) -> Iterator[None]:
+    if not (tracer_ := tracer.get()):
+        yield
+        return
+
+    start = time_ns()
+    counter = perf_counter_ns()
+
+    try:
+        yield
+    finally:
+        tracer_.emit(name, start, perf_counter_ns() - counter, args)
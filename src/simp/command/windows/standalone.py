@@ -7,6 +7,7 @@ from subprocess import CREATE_NEW_CONSOLE, STARTF_USESTDHANDLES, STARTUPINFO, ST
 from typing import Iterator
 from .socketbridge import WinSocket
 from ..base import Executor
+from ..trace import span
 
 
 INVALID_HANDLE_VALUE = -1
@@ -55,12 +56,16 @@ class Standalone(Executor[WinSocket]):
             lpAttributeList=dict(handle_list=handle_list)
         )
 
-        with Popen(command, startupinfo=startupinfo, creationflags=creationflags) as popen:
+        with span('popen', command=command):
+            popen = Popen(command, startupinfo=startupinfo, creationflags=creationflags)
+
+        with popen:
             try:
                 yield popen.pid
             finally:
                 if not wait and popen.poll() is None:
-                    popen.terminate()
+                    with span('terminate', pid=popen.pid):
+                        popen.terminate()
 
     @contextmanager
     def remote(self, command: list[str], *, redirect: WinSocket | None = None, interactive: bool = False, tracable: bool = False, wait: bool = False) -> Iterator[int]:
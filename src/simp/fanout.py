@@ -0,0 +1,121 @@
+from asyncio import Task, create_task, gather, wait as wait_tasks
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from time import perf_counter
+from typing import Awaitable, Callable, Iterable
+
+
+@dataclass
+class Attempt[Candidate, Result]:
+    candidate: Candidate
+    result: Result | None
+    error: Exception | None
+    elapsed: float
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and bool(self.result)
+
+
+@dataclass
+class Report[Candidate, Result]:
+    attempts: list[Attempt[Candidate, Result]] = field(default_factory=list)
+    winner: Attempt[Candidate, Result] | None = None
+    elapsed: float = 0
+
+    @property
+    def latency(self) -> float:
+        return sum(a.elapsed for a in self.attempts) / len(self.attempts) if self.attempts else 0
+
+    @property
+    def throughput(self) -> float:
+        return len(self.attempts) / self.elapsed if self.elapsed else 0
+
+    def add(self, attempt: Attempt[Candidate, Result]) -> bool:
+        self.attempts.append(attempt)
+
+        if attempt.success and not self.winner:
+            self.winner = attempt
+
+        return bool(self.winner)
+
+
+def measure[Candidate, Result](attempt: Callable[[Candidate], Result], candidate: Candidate) -> Attempt[Candidate, Result]:
+    start = perf_counter()
+
+    try:
+        return Attempt(candidate, attempt(candidate), None, perf_counter() - start)
+    except Exception as e:
+        return Attempt(candidate, None, e, perf_counter() - start)
+
+
+async def ameasure[Candidate, Result](attempt: Callable[[Candidate], Awaitable[Result]], candidate: Candidate) -> Attempt[Candidate, Result]:
+    start = perf_counter()
+
+    try:
+        return Attempt(candidate, await attempt(candidate), None, perf_counter() - start)
+    except Exception as e:
+        return Attempt(candidate, None, e, perf_counter() - start)
+
+
+def fanout[Candidate, Result](
+        attempt: Callable[[Candidate], Result],
+        candidates: Iterable[Candidate], *,
+        concurrency: int = 8) -> Report[Candidate, Result]:
+
+    report = Report[Candidate, Result]()
+    candidates = iter(candidates)
+    running: set[Future[Attempt[Candidate, Result]]] = set()
+    executor = ThreadPoolExecutor(concurrency)
+    start = perf_counter()
+
+    try:
+        while True:
+            for candidate in islice(candidates, concurrency - len(running)):
+                running.add(executor.submit(measure, attempt, candidate))
+
+            if not running:
+                break
+
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+
+            if any([report.add(future.result()) for future in done]):
+                break
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    report.elapsed = perf_counter() - start
+    return report
+
+
+async def afanout[Candidate, Result](
+        attempt: Callable[[Candidate], Awaitable[Result]],
+        candidates: Iterable[Candidate], *,
+        concurrency: int = 64) -> Report[Candidate, Result]:
+
+    report = Report[Candidate, Result]()
+    candidates = iter(candidates)
+    running: set[Task[Attempt[Candidate, Result]]] = set()
+    start = perf_counter()
+
+    try:
+        while True:
+            for candidate in islice(candidates, concurrency - len(running)):
+                running.add(create_task(ameasure(attempt, candidate)))
+
+            if not running:
+                break
+
+            done, running = await wait_tasks(running, return_when=FIRST_COMPLETED)
+
+            if any([report.add(task.result()) for task in done]):
+                break
+    finally:
+        for task in running:
+            task.cancel()
+
+        await gather(*running, return_exceptions=True)
+
+    report.elapsed = perf_counter() - start
+    return report
@@ -0,0 +1,64 @@
+from struct import Struct
+from typing import Callable
+from .utility import ORDER, ByteOrder, UINT16_MAX, UINT32_MAX, UINT64_MAX, UINT8_MAX
+
+
+def unpackers(code: str) -> dict[tuple[bool, ByteOrder], Callable[[bytes], tuple[int]]]:
+    return {(signed, byteorder): Struct(ORDER[byteorder] + (code.lower() if signed else code)).unpack for signed in (False, True) for byteorder in ORDER}
+
+
+P8: list[bytes] = [i.to_bytes() for i in range(UINT8_MAX + 1)]
+U16: dict[tuple[bool, ByteOrder], Callable[[bytes], tuple[int]]] = unpackers('H')
+U32: dict[tuple[bool, ByteOrder], Callable[[bytes], tuple[int]]] = unpackers('I')
+U64: dict[tuple[bool, ByteOrder], Callable[[bytes], tuple[int]]] = unpackers('Q')
+
+
+def p8(value: int) -> bytes:
+    return P8[value & UINT8_MAX]
+
+
+def p16(value: int, *, byteorder: ByteOrder = 'little') -> bytes:
+    return (value & UINT16_MAX).to_bytes(2, byteorder)
+
+
+def p32(value: int, *, byteorder: ByteOrder = 'little') -> bytes:
+    return (value & UINT32_MAX).to_bytes(4, byteorder)
+
+
+def p64(value: int, *, byteorder: ByteOrder = 'little') -> bytes:
+    return (value & UINT64_MAX).to_bytes(8, byteorder)
+
+
+def u8(data: bytes, *, signed: bool = False) -> int:
+    return data[0] - ((data[0] & 0x80) << 1 if signed else 0)
+
+
+def u16(data: bytes, *, signed: bool = False, byteorder: ByteOrder = 'little') -> int:
+    return U16[signed, byteorder](data)[0]
+
+
+def u32(data: bytes, *, signed: bool = False, byteorder: ByteOrder = 'little') -> int:
+    return U32[signed, byteorder](data)[0]
+
+
+def u64(data: bytes, *, signed: bool = False, byteorder: ByteOrder = 'little') -> int:
+    return U64[signed, byteorder](data)[0]
+
+
+def block(size: int, filler: bytes, *pair: tuple[int, bytes]) -> bytes:
+    dst = bytearray(filler * size)
+
+    for (i, src) in pair:
+        dst[i:i + len(src)] = src
+
+    return bytes(dst)
+
+
+def rol64(value: int, n: int) -> int:
+    value &= UINT64_MAX
+    n &= 63
+    return ((value << n) | (value >> (64 - n))) & UINT64_MAX
+
+
+def ror64(value: int, n: int) -> int:
+    return rol64(value, -n)
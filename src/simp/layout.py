@@ -0,0 +1,107 @@
+from bisect import bisect_left, bisect_right, insort
+from functools import partial
+from typing import Callable, Self
+from .utility import ByteOrder
+
+
+class Layout:
+    def __init__(self, size: int = 0, filler: bytes = b'\0', *, width: int = 8, byteorder: ByteOrder = 'little'):
+        assert (len(filler) == 1)
+        self.__size: int = size
+        self.__filler: bytes = filler
+        self.__width: int = width
+        self.__byteorder: ByteOrder = byteorder
+        self.__starts: list[int] = []
+        self.__fields: dict[int, bytes | Self] = {}
+        self.__buffer: bytearray | None = None
+        self.__parents: list[tuple[Layout, int]] = []
+
+    def __len__(self) -> int:
+        if not self.__starts:
+            return self.__size
+
+        end = self.__starts[-1] + len(self.__fields[self.__starts[-1]])
+        return max(self.__size, end)
+
+    def __encode(self, value: int | bytes | Self) -> bytes | Self:
+        if isinstance(value, int):
+            assert (-(1 << (self.__width * 8 - 1)) <= value < (1 << (self.__width * 8)))
+            return (value & ((1 << (self.__width * 8)) - 1)).to_bytes(self.__width, self.__byteorder)
+        else:
+            return value
+
+    def __check(self, offset: int, size: int):
+        assert (0 <= offset and (not self.__size or offset + size <= self.__size))
+
+        if i := bisect_left(self.__starts, offset):
+            prev = self.__starts[i - 1]
+            assert (prev + len(self.__fields[prev]) <= offset)
+
+        if (i := bisect_right(self.__starts, offset)) < len(self.__starts):
+            assert (offset + size <= self.__starts[i])
+
+    def __getitem__(self, offset: int) -> bytes | Self:
+        return self.__fields[offset]
+
+    def __setitem__(self, offset: int, value: int | bytes | Self):
+        field = self.__encode(value)
+        self.__check(offset, len(field))
+
+        if offset in self.__fields:
+            del self[offset]
+
+        if isinstance(field, Layout):
+            assert (field is not self and len(field))
+            field.__size = len(field)
+            field.__parents.append((self, offset))
+
+        insort(self.__starts, offset)
+        self.__fields[offset] = field
+        self.__patch(offset, len(field), partial(self.__write, field))
+
+    def __delitem__(self, offset: int):
+        field = self.__fields.pop(offset)
+        self.__starts.remove(offset)
+
+        if isinstance(field, Layout):
+            field.__parents.remove((self, offset))
+
+        self.__patch(offset, len(field), partial(self.__write, self.__filler * len(field)))
+
+    def __patch(self, offset: int, size: int, write: Callable[[memoryview], None]):
+        if self.__buffer is not None and len(self.__buffer) == len(self):
+            with memoryview(self.__buffer) as view:
+                write(view[offset:offset + size])
+        else:
+            self.__buffer = None
+
+        for parent, base in self.__parents:
+            parent.__patch(base + offset, size, write)
+
+    @staticmethod
+    def __write(field: bytes | Self, view: memoryview):
+        if isinstance(field, Layout):
+            field.render_into(view)
+        else:
+            view[:] = field
+
+    def __render(self, view: memoryview):
+        for offset in self.__starts:
+            field = self.__fields[offset]
+            self.__write(field, view[offset:offset + len(field)])
+
+    def render_into(self, view: memoryview):
+        view[:] = self.__filler * len(view)
+        self.__render(view)
+
+    def render(self) -> bytearray:
+        if self.__buffer is None:
+            self.__buffer = bytearray(self.__filler) * len(self)
+
+            with memoryview(self.__buffer) as view:
+                self.__render(view)
+
+        return self.__buffer
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.render())
@@ -1,11 +1,20 @@
-from contextlib import ExitStack, contextmanager, suppress
+from contextlib import ExitStack, closing, contextmanager, suppress
+from functools import partial
 from multiprocessing import Process
-from os import write
-from selectors import EVENT_READ, DefaultSelector
+from os import close, pipe
+from selectors import EVENT_READ, EVENT_WRITE, DefaultSelector
 from socket import socket, socketpair
-from ssl import SSLWantReadError, SSLWantWriteError
-from sys import platform, stderr, stdout
-from typing import Iterator
+from ssl import SSLSocket, SSLWantReadError, SSLWantWriteError
+from sys import platform, stdout
+from threading import Thread
+from typing import Callable, Iterator, Literal
+from .buffered import Buffer, Chunk
+from .capture import Capture, endpoints
+from .sink import Sink
+
+if platform == 'linux':
+    from fcntl import F_GETPIPE_SZ, F_SETPIPE_SZ, fcntl
+    from os import SPLICE_F_MOVE, SPLICE_F_NONBLOCK, splice
 
 
 class Color:
@@ -28,40 +37,28 @@ class Color:
     WHITE: str = __ansi('\033[37m')
 
 
-def lines(data: bytes) -> Iterator[str]:
-    def dumpq(data: bytes) -> str:
-        emphasize = [0x0a, 0x55, 0x7f, 0xff]
-        text = ''
-
-        for i in range(8):
-            if i < len(data):
-                b = data[i]
-
-                if b in emphasize:
-                    text += f'{Color.GREEN}{b:02x}{Color.END}'
-                else:
-                    text += f'{b:02x}'
-            else:
-                text += '  '
+HEXTABLE: list[str] = [f'{Color.GREEN}{b:02x}{Color.END}' if b in [0x0a, 0x55, 0x7f, 0xff] else f'{b:02x}' for b in range(0x100)]
+ASCIITABLE: bytes = bytes(b if ord(' ') <= b <= ord('~') else ord('.') for b in range(0x100))
 
-        return text
 
-    def dumps(data: bytes) -> str:
-        text = bytearray(data)
+def lines(data: bytes) -> Iterator[str]:
+    if Color.GREEN:
+        hexes = list(map(HEXTABLE.__getitem__, data))
 
-        for i, b in enumerate(text):
-            if not ord(' ') <= b <= ord('~'):
-                text[i] = ord('.')
+        def dumpq(begin: int, end: int) -> str:
+            part = hexes[begin:end]
+            return ''.join(part) + '  ' * (8 - len(part))
+    else:
+        text = data.hex()
 
-        return text.decode()
+        def dumpq(begin: int, end: int) -> str:
+            return text[begin * 2:end * 2].ljust(16)
 
-    offset = 0
+    dumps = data.translate(ASCIITABLE).decode()
 
-    while data:
-        fst, snd, data = data[:8], data[8:16], data[16:]
-        left, middle, right = dumpq(fst), dumpq(snd), dumps(fst + snd)
+    for offset in range(0, len(data), 0x10):
+        left, middle, right = dumpq(offset, offset + 8), dumpq(offset + 8, offset + 16), dumps[offset:offset + 16]
         yield f'{Color.CYAN}[{offset:03x}]{Color.END} {left} {middle} {right}'
-        offset += 0x10
 
 
 def border(char: str) -> str:
@@ -69,10 +66,7 @@ def border(char: str) -> str:
 
 
 def hexdump(data: bytes, header: str) -> str:
-    text = ''
-
-    for line in lines(data):
-        text += f'{header} {line}\n'
+    text = ''.join(f'{header} {line}\n' for line in lines(data))
 
     if text:
         text = f'{header} {border('-')}\n' + text
@@ -80,43 +74,215 @@ def hexdump(data: bytes, header: str) -> str:
     return text
 
 
-def transfer(dst: socket, src: socket, header: str, verbose: int) -> bool:
-    eof = False
-    buffer = b''
-    dst.setblocking(True)
-    src.setblocking(False)
-
-    with suppress(BlockingIOError, SSLWantReadError, SSLWantWriteError):
-        while True:
-            if data := src.recv(0x1000):
-                buffer += data
-            else:
-                eof = True
-                break
-
+def log(data: bytes, header: str, verbose: int) -> bytes:
     message = b''
 
     if verbose == 1:
-        message = buffer
+        message = data
 
     if verbose >= 2:
-        message = hexdump(buffer, header).encode()
+        message = hexdump(data, header).encode()
+
+    return message
+
+
+class Transfer:
+    def __init__(
+            self, dst: socket, src: socket, header: str, verbose: int,
+            write: Callable[[bytes], None] | None, record: Callable[[bytes], None] | None, limit: int = 0x100000):
+
+        self.__dst: socket = dst
+        self.__src: socket = src
+        self.__header: str = header
+        self.__verbose: int = verbose
+        self.__write: Callable[[bytes], None] | None = write
+        self.__record: Callable[[bytes], None] | None = record
+        self.__limit: int = limit
+        self.__buffer: Buffer = Buffer()
+        self.__chunk: Chunk = Chunk()
+        self.eof: bool = False
+
+    @property
+    def readable(self) -> bool:
+        return not self.eof and len(self.__buffer) < self.__limit
+
+    @property
+    def writable(self) -> bool:
+        return bool(self.__buffer)
+
+    @property
+    def pending(self) -> bool:
+        return self.readable and isinstance(self.__src, SSLSocket) and self.__src.pending() > 0
+
+    @property
+    def done(self) -> bool:
+        return self.eof and not self.__buffer
+
+    def recv(self):
+        total = 0
+
+        while self.readable and (total < self.__limit or isinstance(self.__src, SSLSocket) and self.__src.pending()):
+            try:
+                data = self.__src.recv(min(self.__chunk.size, self.__limit - len(self.__buffer)))
+            except (BlockingIOError, SSLWantReadError, SSLWantWriteError):
+                self.__chunk.idle()
+                break
+
+            if not data:
+                self.eof = True
+                break
+
+            self.__chunk.update(len(data))
+            total += len(data)
+
+            if self.__write:
+                self.__write(log(data, self.__header, self.__verbose))
+
+            if self.__record:
+                self.__record(data)
+
+            self.__buffer.write(data)
+            self.send()
+
+    def send(self):
+        with suppress(BlockingIOError, SSLWantReadError, SSLWantWriteError):
+            while self.__buffer:
+                self.__buffer.drain(self.__dst.send)
+
+    def close(self):
+        pass
+
 
-    write(stderr.fileno(), message)
+class SpliceTransfer:
+    def __init__(self, dst: socket, src: socket, limit: int = 0x100000):
+        self.__dst: socket = dst
+        self.__src: socket = src
+        self.__limit: int = limit
+        self.__pipe: tuple[int, int] = pipe()
+        self.__pending: int = 0
+        self.__full: bool = False
+        self.eof: bool = False
 
-    while buffer:
-        n = dst.send(buffer)
-        buffer = buffer[n:]
+        with suppress(OSError):
+            fcntl(self.__pipe[1], F_SETPIPE_SZ, limit)
 
-    return eof
+        self.__limit = fcntl(self.__pipe[1], F_GETPIPE_SZ)
+
+    @property
+    def readable(self) -> bool:
+        return not self.eof and not self.__full and self.__pending < self.__limit
+
+    @property
+    def writable(self) -> bool:
+        return bool(self.__pending)
+
+    @property
+    def pending(self) -> bool:
+        return False
+
+    @property
+    def done(self) -> bool:
+        return self.eof and not self.__pending
+
+    def recv(self):
+        total = 0
+
+        while self.readable and total < self.__limit:
+            try:
+                n = splice(self.__src.fileno(), self.__pipe[1], self.__limit - self.__pending, flags=SPLICE_F_MOVE | SPLICE_F_NONBLOCK)
+            except BlockingIOError:
+                self.__full = self.__pending > 0
+                break
+
+            if not n:
+                self.eof = True
+                break
+
+            total += n
+            self.__pending += n
+            self.send()
+
+    def send(self):
+        with suppress(BlockingIOError):
+            while self.__pending:
+                self.__pending -= splice(self.__pipe[0], self.__dst.fileno(), self.__pending, flags=SPLICE_F_MOVE | SPLICE_F_NONBLOCK)
+                self.__full = False
+
+    def close(self):
+        for fd in self.__pipe:
+            close(fd)
+
+
+def transfer(
+        dst: socket, src: socket, header: str, verbose: int,
+        write: Callable[[bytes], None] | None, record: Callable[[bytes], None] | None) -> Transfer | SpliceTransfer:
+
+    if platform == 'linux' and not write and not record and not isinstance(dst, SSLSocket) and not isinstance(src, SSLSocket):
+        return SpliceTransfer(dst, src)
+    else:
+        return Transfer(dst, src, header, verbose, write, record)
+
+
+def relay(external: socket, internal: socket, verbose: int, sink: Sink, capture: str, stop: socket):
+    with ExitStack() as estack:
+        write = estack.enter_context(sink.open()) if verbose else None
+        pcap = estack.enter_context(closing(Capture(capture, *endpoints(external)))) if capture else None
+        outbound = estack.enter_context(closing(transfer(
+            external, internal, '  >', verbose, write, pcap and partial(pcap.record, outbound=True))))
+        inbound = estack.enter_context(closing(transfer(
+            internal, external, '    <', verbose, write, pcap and partial(pcap.record, outbound=False))))
+        selector = estack.enter_context(DefaultSelector())
+        readers = {internal: outbound, external: inbound}
+        writers = {external: outbound, internal: inbound}
+        registered = {internal: EVENT_READ, external: EVENT_READ}
+
+        for sk in readers:
+            sk.setblocking(False)
+            selector.register(sk, EVENT_READ)
+
+        selector.register(stop, EVENT_READ)
+
+        while not (outbound.done or inbound.done):
+            for key, events in selector.select():
+                if key.fileobj is stop:
+                    return
+
+                if events & EVENT_READ:
+                    readers[key.fileobj].recv()
+
+                if events & EVENT_WRITE:
+                    writers[key.fileobj].send()
+
+            for transfer_ in (outbound, inbound):
+                if transfer_.pending:
+                    transfer_.recv()
+
+            for sk in readers:
+                events = (EVENT_READ if readers[sk].readable else 0) | (EVENT_WRITE if writers[sk].writable else 0)
+
+                if events == registered[sk]:
+                    continue
+                elif not events:
+                    selector.unregister(sk)
+                elif not registered[sk]:
+                    selector.register(sk, events)
+                else:
+                    selector.modify(sk, events)
+
+                registered[sk] = events
 
 
 class Monitor(Process):
-    def __init__(self, external: socket, internal: socket, verbose: int):
+    grace: float = 5
+
+    def __init__(self, external: socket, internal: socket, verbose: int, sink: Sink, capture: str):
         super().__init__()
         self.__external: socket = external
         self.__internal: socket = internal
         self.__verbose: int = verbose
+        self.__sink: Sink = sink
+        self.__capture: str = capture
+        self.__stop: tuple[socket, socket] = socketpair()
 
     def run(self):
         if platform == 'linux':
@@ -124,26 +290,67 @@ class Monitor(Process):
 
             setpgid(0, 0)
 
-        with DefaultSelector() as selector:
-            selector.register(self.__internal, EVENT_READ, lambda: transfer(self.__external, self.__internal, '  >', self.__verbose))
-            selector.register(self.__external, EVENT_READ, lambda: transfer(self.__internal, self.__external, '    <', self.__verbose))
+        relay(self.__external, self.__internal, self.__verbose, self.__sink, self.__capture, self.__stop[0])
+
+    def terminate(self):
+        self.__stop[1].send(b'\0')
+        self.join(self.grace)
+
+        if self.is_alive():
+            super().terminate()
+            self.join(self.grace)
 
-            while True:
-                for key, _ in selector.select():
-                    if key.data():
-                        return
+        if self.is_alive():
+            self.kill()
+
+    def close(self):
+        super().close()
+
+        for sk in self.__stop:
+            sk.close()
+
+
+class MonitorThread(Thread):
+    def __init__(self, external: socket, internal: socket, verbose: int, sink: Sink, capture: str):
+        super().__init__(daemon=True)
+        self.__external: socket = external
+        self.__internal: socket = internal
+        self.__verbose: int = verbose
+        self.__sink: Sink = sink
+        self.__capture: str = capture
+        self.__stop: tuple[socket, socket] = socketpair()
+
+    def run(self):
+        relay(self.__external, self.__internal, self.__verbose, self.__sink, self.__capture, self.__stop[0])
+
+    def terminate(self):
+        self.__stop[1].send(b'\0')
+
+    def close(self):
+        for sk in self.__stop:
+            sk.close()
+
+
+type Backend = Literal['process', 'thread']
 
 
 @contextmanager
-def monitor(external: socket, *, verbose: int = 1) -> Iterator[socket]:
+def monitor(external: socket, *, verbose: int = 1, backend: Backend = 'process', sink: Sink = Sink(), capture: str = '') -> Iterator[socket]:
     pair = socketpair()
 
     with pair[0]:
         with ExitStack() as estack:
             estack.enter_context(pair[1])
-            proc = Monitor(external, pair[1], verbose)
-            proc.start()
-            estack.pop_all().close()
+
+            match backend:
+                case 'process':
+                    proc = Monitor(external, pair[1], verbose, sink, capture)
+                    proc.start()
+                    estack.pop_all().close()
+
+                case 'thread':
+                    proc = MonitorThread(external, pair[1], verbose, sink, capture)
+                    proc.start()
 
             try:
                 yield pair[0]
@@ -0,0 +1,120 @@
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from socket import MSG_WAITALL, SHUT_RDWR, SHUT_WR, socket, socketpair
+from struct import Struct
+from threading import Event as Flag, Thread
+from time import perf_counter_ns
+from typing import BinaryIO, Iterator
+from .buffered import BufferedSocket, Chunk, Stats
+
+
+MAGIC: bytes = b'SIMPREC\x01'
+HEADER: Struct = Struct('<?QI')
+
+
+@dataclass
+class Event:
+    outbound: bool
+    timestamp: int
+    data: bytes
+
+
+def events(path: str) -> Iterator[Event]:
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError
+
+        while header := file.read(HEADER.size):
+            outbound, timestamp, size = HEADER.unpack(header)
+            yield Event(outbound, timestamp, file.read(size))
+
+
+class RecordingSocket(BufferedSocket):
+    def __init__(self, sk: socket, file: BinaryIO, *, chunk: Chunk | None = None, stats: Stats | None = None):
+        super().__init__(sk, chunk=chunk, stats=stats)
+        self.__file: BinaryIO = file
+        self.__start: int = perf_counter_ns()
+        self.__file.write(MAGIC)
+
+    def __record(self, outbound: bool, buffers: list[memoryview], size: int):
+        self.__file.write(HEADER.pack(outbound, perf_counter_ns() - self.__start, size))
+
+        for buffer in buffers:
+            if size <= 0:
+                break
+
+            self.__file.write(buffer[:size])
+            size -= len(buffer)
+
+    def _send(self, buffers: list[memoryview]) -> int:
+        n = super()._send(buffers)
+        self.__record(True, buffers, n)
+        return n
+
+    def _recv_into(self, buffer: memoryview) -> int:
+        n = super()._recv_into(buffer)
+
+        if n:
+            self.__record(False, [buffer], n)
+
+        return n
+
+
+@contextmanager
+def record(sk: socket, path: str, *, chunk: Chunk | None = None, stats: Stats | None = None) -> Iterator[RecordingSocket]:
+    with open(path, 'wb', buffering=0x10000) as file:
+        yield RecordingSocket(sk, file, chunk=chunk, stats=stats)
+
+
+class Player(Thread):
+    def __init__(self, sk: socket, path: str, speed: float, strict: bool):
+        super().__init__(daemon=True)
+        self.__sk: socket = sk
+        self.__path: str = path
+        self.__speed: float = speed
+        self.__strict: bool = strict
+        self.__stop: Flag = Flag()
+
+    def run(self):
+        start = perf_counter_ns()
+
+        with suppress(OSError), self.__sk:
+            for event in events(self.__path):
+                if self.__stop.is_set():
+                    return
+
+                if event.outbound:
+                    data = self.__sk.recv(len(event.data), MSG_WAITALL)
+
+                    if self.__strict and data != event.data:
+                        return
+                else:
+                    if self.__speed > 0 and (delay := event.timestamp / self.__speed - (perf_counter_ns() - start)) > 0:
+                        if self.__stop.wait(delay / 1e9):
+                            return
+
+                    self.__sk.sendall(event.data)
+
+            self.__sk.shutdown(SHUT_WR)
+
+    def terminate(self):
+        self.__stop.set()
+
+
+@contextmanager
+def replay(path: str, *, speed: float = 0, strict: bool = True) -> Iterator[socket]:
+    pair = socketpair()
+
+    with pair[0]:
+        player = Player(pair[1], path, speed, strict)
+        player.start()
+
+        try:
+            yield pair[0]
+        finally:
+            player.terminate()
+
+            with suppress(OSError):
+                pair[0].shutdown(SHUT_RDWR)
+
+            player.join()
@@ -0,0 +1,108 @@
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from os import replace
+from pathlib import Path
+from sys import stderr
+from threading import Condition, Thread
+from typing import BinaryIO, Callable, Iterator, Literal
+
+
+type Policy = Literal['block', 'drop']
+
+
+@dataclass
+class Sink:
+    path: str = ''
+    maxbytes: int = 0
+    backups: int = 1
+    limit: int = 0x400000
+    policy: Policy = 'block'
+
+    def rotate(self):
+        for i in range(self.backups - 1, 0, -1):
+            if Path(f'{self.path}.{i}').exists():
+                replace(f'{self.path}.{i}', f'{self.path}.{i + 1}')
+
+        if self.backups > 0:
+            replace(self.path, f'{self.path}.1')
+        else:
+            Path(self.path).unlink()
+
+    def file(self) -> BinaryIO:
+        if self.path:
+            return open(self.path, 'ab')
+        else:
+            return open(stderr.fileno(), 'wb', closefd=False)
+
+    @contextmanager
+    def open(self) -> Iterator[Callable[[bytes], None]]:
+        writer = SinkWriter(self)
+        writer.start()
+
+        try:
+            yield writer.put
+        finally:
+            writer.close()
+
+
+class SinkWriter(Thread):
+    def __init__(self, sink: Sink):
+        super().__init__(daemon=True)
+        self.__sink: Sink = sink
+        self.__queue: deque[bytes] = deque()
+        self.__size: int = 0
+        self.__closed: bool = False
+        self.__condition: Condition = Condition()
+        self.dropped: int = 0
+
+    def put(self, message: bytes):
+        with self.__condition:
+            if self.__queue and self.__size + len(message) > self.__sink.limit:
+                if self.__sink.policy == 'drop':
+                    self.dropped += len(message)
+                    return
+
+                self.__condition.wait_for(lambda: not self.__queue or self.__size + len(message) <= self.__sink.limit)
+
+            self.__queue.append(message)
+            self.__size += len(message)
+            self.__condition.notify_all()
+
+    def __take(self) -> list[bytes]:
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__queue or self.__closed)
+            batch = list(self.__queue)
+            self.__queue.clear()
+            self.__size = 0
+            self.__condition.notify_all()
+            return batch
+
+    def run(self):
+        file = self.__sink.file()
+        rotating = bool(self.__sink.path and self.__sink.maxbytes)
+
+        try:
+            while batch := self.__take():
+                data = memoryview(b''.join(batch))
+
+                while data:
+                    if rotating and file.tell() >= self.__sink.maxbytes:
+                        file.close()
+                        self.__sink.rotate()
+                        file = self.__sink.file()
+
+                    size = self.__sink.maxbytes - file.tell() if rotating else len(data)
+                    file.write(data[:size])
+                    data = data[size:]
+
+                file.flush()
+        finally:
+            file.close()
+
+    def close(self):
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+        self.join()
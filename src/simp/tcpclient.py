@@ -1,24 +1,121 @@
+from asyncio import get_running_loop, sleep as asleep, timeout as timeout_
 from contextlib import suppress
+from dataclasses import dataclass
+from math import inf
+from random import uniform
 from socket import socket
 from ssl import CERT_NONE, PROTOCOL_TLS_CLIENT, SSLContext
+from time import monotonic, sleep
+from typing import Awaitable, Callable, Iterator
+from .asyncbuffered import AsyncBufferedSocket, StreamProtocol
 
 
-def connect(host: str, port: int, context: SSLContext | None = None) -> socket:
-    sk = socket()
+@dataclass
+class Backoff:
+    initial: float = 0.01
+    maximum: float = 1
+    factor: float = 2
 
-    try:
-        if context:
-            sk = context.wrap_socket(sk)
+    def __iter__(self) -> Iterator[float]:
+        delay = self.initial
 
         while True:
-            with suppress(ConnectionError):
+            yield uniform(0, delay)
+            delay = min(delay * self.factor, self.maximum)
+
+
+def budget(deadline: float, limit: float = inf) -> float | None:
+    if (remaining := min(deadline - monotonic(), limit)) <= 0:
+        raise TimeoutError
+
+    return remaining if remaining != inf else None
+
+
+def connect(
+        host: str,
+        port: int,
+        context: SSLContext | None = None, *,
+        timeout: float = -1,
+        attempt: float = 1,
+        backoff: Backoff = Backoff(),
+        probe: Callable[[socket], bool] | None = None) -> socket:
+
+    deadline = monotonic() + timeout if timeout > 0 else inf
+    delays = iter(backoff)
+
+    while True:
+        sk = socket()
+
+        try:
+            with suppress(ConnectionError, TimeoutError):
+                sk.settimeout(budget(deadline, attempt))
                 sk.connect((host, port))
-                break
 
-        return sk
-    except:
+                if context:
+                    sk.settimeout(budget(deadline))
+                    sk = context.wrap_socket(sk, server_hostname=host)
+
+                sk.settimeout(None)
+
+                if not probe or probe(sk):
+                    return sk
+        except:
+            sk.close()
+            raise
+
         sk.close()
-        raise
+
+        if not timeout or (remaining := deadline - monotonic()) <= 0:
+            raise TimeoutError
+
+        sleep(min(next(delays), remaining))
+
+
+async def aconnect(
+        host: str,
+        port: int,
+        context: SSLContext | None = None, *,
+        timeout: float = -1,
+        attempt: float = 1,
+        backoff: Backoff = Backoff(),
+        probe: Callable[[AsyncBufferedSocket], Awaitable[bool]] | None = None,
+        limit: int = 0x100000) -> AsyncBufferedSocket:
+
+    loop = get_running_loop()
+    deadline = monotonic() + timeout if timeout > 0 else inf
+    delays = iter(backoff)
+
+    while True:
+        with suppress(ConnectionError, TimeoutError):
+            raw = socket()
+            raw.setblocking(False)
+
+            try:
+                async with timeout_(budget(deadline, attempt)):
+                    await loop.sock_connect(raw, (host, port))
+
+                async with timeout_(budget(deadline)):
+                    transport, protocol = await loop.create_connection(
+                        lambda: StreamProtocol(limit), sock=raw, ssl=context, server_hostname=host if context else None)
+            except:
+                raw.close()
+                raise
+
+            sk = AsyncBufferedSocket(transport, protocol)
+
+            try:
+                if not probe or await probe(sk):
+                    return sk
+            except:
+                sk.close()
+                raise
+
+            sk.close()
+
+        if not timeout or (remaining := deadline - monotonic()) <= 0:
+            raise TimeoutError
+
+        await asleep(min(next(delays), remaining))
 
 
 def unsafeSSL() -> SSLContext:
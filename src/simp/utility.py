@@ -1,7 +1,9 @@
-from itertools import cycle
-from string import digits, ascii_letters
-from struct import pack, unpack
-from typing import Iterator, Literal, Self
+from array import array
+from itertools import cycle, islice
+from string import ascii_letters, ascii_lowercase, digits
+from struct import Struct
+from sys import byteorder as native
+from typing import Any, Iterable, Iterator, Literal, Self, cast
 
 
 INT8_MIN: int = -(1 << 7)
@@ -15,6 +17,11 @@ UINT64_MAX: int = (1 << 64) - 1
 
 type ByteOrder = Literal['little', 'big']
 
+ORDER: dict[ByteOrder, str] = {'little': '<', 'big': '>'}
+TYPECODE: dict[tuple[int, bool], str] = {(array(c).itemsize, c.islower()): c for c in 'bBhHiIlLqQ'}
+FLOAT: dict[ByteOrder, Struct] = {'little': Struct('<f'), 'big': Struct('>f')}
+DOUBLE: dict[ByteOrder, Struct] = {'little': Struct('<d'), 'big': Struct('>d')}
+
 
 def p8(value: int) -> bytes:
     assert (INT8_MIN <= value <= UINT8_MAX)
@@ -37,13 +44,11 @@ def p64(value: int, *, byteorder: ByteOrder = 'little') -> bytes:
 
 
 def pf(value: float, *, byteorder: ByteOrder = 'little') -> bytes:
-    fmt = dict(little='<f', big='>f')
-    return pack(fmt[byteorder], value)
+    return FLOAT[byteorder].pack(value)
 
 
 def pd(value: float, *, byteorder: ByteOrder = 'little') -> bytes:
-    fmt = dict(little='<d', big='>d')
-    return pack(fmt[byteorder], value)
+    return DOUBLE[byteorder].pack(value)
 
 
 def u8(data: bytes, *, signed: bool = False) -> int:
@@ -66,16 +71,94 @@ def u64(data: bytes, *, signed: bool = False, byteorder: ByteOrder = 'little') -
     return int.from_bytes(data, signed=signed, byteorder=byteorder)
 
 
-def uf(data: bytes, *, byteorder: ByteOrder = 'little') -> int:
+def uf(data: bytes, *, byteorder: ByteOrder = 'little') -> float:
     assert (len(data) == 4)
-    fmt = dict(little='<f', big='>f')
-    return unpack(fmt[byteorder], data)[0]
+    return FLOAT[byteorder].unpack(data)[0]
 
 
-def ud(data: bytes, *, byteorder: ByteOrder = 'little') -> int:
+def ud(data: bytes, *, byteorder: ByteOrder = 'little') -> float:
     assert (len(data) == 8)
-    fmt = dict(little='<d', big='>d')
-    return unpack(fmt[byteorder], data)[0]
+    return DOUBLE[byteorder].unpack(data)[0]
+
+
+def reorder(words: array, byteorder: ByteOrder) -> array:
+    if byteorder != native and words.itemsize > 1:
+        words.byteswap()
+
+    return words
+
+
+def pack_many(values: Iterable[int], *, width: int = 8, byteorder: ByteOrder = 'little') -> bytes:
+    if hasattr(values, 'astype'):
+        return cast(Any, values).astype(f'{ORDER[byteorder]}u{width}').tobytes()
+
+    values = values if isinstance(values, list) else list(values)
+
+    try:
+        words = array(TYPECODE[width, False], values)
+    except OverflowError:
+        assert (all(-(1 << (width * 8 - 1)) <= value < (1 << (width * 8)) for value in values))
+        words = array(TYPECODE[width, False], [value & ((1 << (width * 8)) - 1) for value in values])
+
+    return reorder(words, byteorder).tobytes()
+
+
+def unpack_array(data: bytes | bytearray | memoryview, *, width: int = 8, signed: bool = False, byteorder: ByteOrder = 'little') -> array:
+    assert (len(data) % width == 0)
+    words = array(TYPECODE[width, signed])
+    words.frombytes(data)
+    return reorder(words, byteorder)
+
+
+def unpack_many(data: bytes | bytearray | memoryview, *, width: int = 8, signed: bool = False, byteorder: ByteOrder = 'little') -> list[int]:
+    return unpack_array(data, width=width, signed=signed, byteorder=byteorder).tolist()
+
+
+def pf_many(values: Iterable[float], *, byteorder: ByteOrder = 'little') -> bytes:
+    return reorder(array('f', values), byteorder).tobytes()
+
+
+def pd_many(values: Iterable[float], *, byteorder: ByteOrder = 'little') -> bytes:
+    return reorder(array('d', values), byteorder).tobytes()
+
+
+def uf_many(data: bytes | bytearray | memoryview, *, byteorder: ByteOrder = 'little') -> list[float]:
+    assert (len(data) % 4 == 0)
+    words = array('f')
+    words.frombytes(data)
+    return reorder(words, byteorder).tolist()
+
+
+def ud_many(data: bytes | bytearray | memoryview, *, byteorder: ByteOrder = 'little') -> list[float]:
+    assert (len(data) % 8 == 0)
+    words = array('d')
+    words.frombytes(data)
+    return reorder(words, byteorder).tolist()
+
+
+def flat(*values: int | bytes | Iterable, width: int = 8, byteorder: ByteOrder = 'little') -> bytes:
+    chunks: list[bytes] = []
+    words: list[int] = []
+
+    for value in values:
+        if isinstance(value, int):
+            words.append(value)
+            continue
+
+        if words:
+            chunks.append(pack_many(words, width=width, byteorder=byteorder))
+            words = []
+
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            chunks.append(bytes(value))
+        else:
+            assert (not isinstance(value, str))
+            chunks.append(flat(*value, width=width, byteorder=byteorder))
+
+    if words:
+        chunks.append(pack_many(words, width=width, byteorder=byteorder))
+
+    return b''.join(chunks)
 
 
 def block(size: int, filler: bytes, *pair: tuple[int, bytes]) -> bytes:
@@ -104,6 +187,141 @@ class Iota(bytearray):
 iota: Iota = Iota()
 
 
+def lyndon(k: int, n: int) -> Iterator[list[int]]:
+    word = [-1]
+
+    while word:
+        word[-1] += 1
+        m = len(word)
+
+        if n % m == 0:
+            yield word
+
+        while len(word) < n:
+            word.append(word[-m])
+
+        while word and word[-1] == k - 1:
+            word.pop()
+
+
+def rank(word: bytes, k: int) -> int:
+    n = len(word)
+    fail = [-1] + [0] * n
+
+    for i in range(1, n + 1):
+        j = fail[i - 1]
+
+        while j >= 0 and word[j] != word[i - 1]:
+            j = fail[j]
+
+        fail[i] = j + 1
+
+    edges: list[tuple[int, int]] = []
+
+    for i in range(n):
+        chain = [i]
+
+        while fail[chain[-1]] >= 0:
+            chain.append(fail[chain[-1]])
+
+        m = max(word[j] for j in chain)
+        j = next(j for j in chain if word[j] == m) + 1
+        edges.append((j if j < n else fail[n], k - m - 1))
+
+    total = 0
+
+    for q in range(n):
+        count = [0] * n
+        count[q] = 1
+
+        for _ in range(n):
+            step = [0] * n
+
+            for i, c in enumerate(count):
+                if c:
+                    step[edges[i][0]] += c
+                    step[0] += c * edges[i][1]
+
+            count = step
+
+        total += count[q]
+
+    return k ** n - total
+
+
+class Cyclic:
+    def __init__(self, alphabet: bytes = ascii_lowercase.encode(), n: int = 4):
+        assert (0 < len(set(alphabet)) == len(alphabet) and n > 0)
+        self.__alphabet: bytes = alphabet
+        self.__n: int = n
+        self.__symbols: bytes = bytes.maketrans(bytes(range(len(alphabet))), alphabet)
+        self.__digits: bytes = bytes.maketrans(alphabet, bytes(range(len(alphabet))))
+
+    def __len__(self) -> int:
+        return len(self.__alphabet) ** self.__n + self.__n - 1
+
+    def __chunks(self, size: int = 0x10000) -> Iterator[bytes]:
+        words = lyndon(len(self.__alphabet), self.__n)
+
+        while chunk := b''.join(bytes(word) for word in islice(words, size // self.__n + 1)):
+            yield chunk.translate(self.__symbols)
+
+        yield self.__alphabet[:1] * (self.__n - 1)
+
+    def stream(self, size: int) -> Iterator[bytes]:
+        assert (0 <= size <= len(self))
+
+        for chunk in self.__chunks():
+            if size <= len(chunk):
+                yield chunk[:size]
+                return
+
+            size -= len(chunk)
+            yield chunk
+
+    def __call__(self, size: int) -> bytes:
+        return b''.join(self.stream(size))
+
+    def __locate(self, window: bytes) -> int:
+        k, n = len(self.__alphabet), self.__n
+        z = k - 1
+
+        if window.count(z) == n:
+            return k ** n - n
+
+        necklace = min(window[i:] + window[:i] for i in range(n))
+        d = next(d for d in range(1, n + 1) if n % d == 0 and necklace[:d] * (n // d) == necklace)
+        o = next(o for o in range(d) if necklace[o:] + necklace[:o] == window)
+
+        if necklace[o:d].count(z) != d - o:
+            return rank(necklace, k) + o
+
+        t = n - len(window.lstrip(bytes([z])))
+        return (rank(window[t:] + bytes(t), k) - t) % k ** n
+
+    def find(self, sub: bytes | int, *, width: int = 0, byteorder: ByteOrder = 'little') -> int:
+        if isinstance(sub, int):
+            width = width or self.__n
+            sub = (sub & ((1 << (width * 8)) - 1)).to_bytes(width, byteorder)
+
+        assert (len(sub) >= self.__n)
+
+        if not set(sub) <= set(self.__alphabet):
+            return -1
+
+        digits = sub.translate(self.__digits)
+        pos = self.__locate(digits[:self.__n])
+
+        for i in range(1, len(sub) - self.__n + 1):
+            if self.__locate(digits[i:i + self.__n]) != pos + i:
+                return -1
+
+        return pos
+
+
+cyclic: Cyclic = Cyclic()
+
+
 def rol64(value: int, n: int) -> int:
     assert (INT64_MIN <= value <= UINT64_MAX)
     assert (-63 <= n <= 63)